@@ -3,14 +3,14 @@ Blob resource type serialization.
 """
 
 import struct
-from typing import Optional
+from typing import Optional, Union
 
 from .resource import (
+    COMMON_DESCRIPTOR_FORMAT,
     COMMON_DESCRIPTOR_SIZE,
     CommonResourceDescriptor,
     ResourceType,
     deserialize_common_resource_descriptor,
-    serialize_common_resource_descriptor,
 )
 from .resource_format import Format
 
@@ -18,6 +18,12 @@ EXTENDED_DESCRIPTOR_FORMAT = "=Q"
 EXTENDED_DESCRIPTOR_SIZE = struct.calcsize(EXTENDED_DESCRIPTOR_FORMAT)
 TOTAL_DESCRIPTOR_SIZE = COMMON_DESCRIPTOR_SIZE + EXTENDED_DESCRIPTOR_SIZE
 
+_EXTENDED_DESCRIPTOR_STRUCT = struct.Struct(EXTENDED_DESCRIPTOR_FORMAT)
+_TOTAL_DESCRIPTOR_STRUCT = struct.Struct(COMMON_DESCRIPTOR_FORMAT + EXTENDED_DESCRIPTOR_FORMAT[1:])
+
+_FORMAT_UNDEFINED = Format.UNDEFINED.value
+_RESOURCE_TYPE_BLOB = ResourceType.BLOB.value
+
 
 class BlobResourceDescriptor(CommonResourceDescriptor):
     """The resource descriptor for blob resources."""
@@ -40,9 +46,9 @@ def make_blob_resource_descriptor(
     return {
         "content_size": compressed_data_size,
         "extension_size": EXTENDED_DESCRIPTOR_SIZE,
-        "format": Format.UNDEFINED.value,
+        "format": _FORMAT_UNDEFINED,
         "supercompression_scheme": supercompression_scheme,
-        "type": ResourceType.BLOB.value,
+        "type": _RESOURCE_TYPE_BLOB,
         "uncompressed_size": uncompressed_data_size,
     }
 
@@ -54,21 +60,26 @@ def serialize_blob_descriptor(descriptor: BlobResourceDescriptor) -> bytes:
 
     :returns: The serialized descriptor.
     """
-    common_descriptor_data = serialize_common_resource_descriptor(descriptor)
-    extended_descriptor_data = struct.pack(EXTENDED_DESCRIPTOR_FORMAT, descriptor["uncompressed_size"])
 
-    return common_descriptor_data + extended_descriptor_data
+    return _TOTAL_DESCRIPTOR_STRUCT.pack(
+        descriptor["type"],
+        descriptor["format"],
+        descriptor["content_size"],
+        descriptor["extension_size"],
+        descriptor["supercompression_scheme"],
+        descriptor["uncompressed_size"],
+    )
 
 
 def deserialize_blob_descriptor(
-    raw: bytes, common_descriptor: Optional[CommonResourceDescriptor] = None
+    raw: Union[bytes, memoryview], common_descriptor: Optional[CommonResourceDescriptor] = None
 ) -> BlobResourceDescriptor:
     """Deserialize a blob resource descriptor.
 
     This function will not attempt to deserialize the common descriptor a second time
     if this is provided via argument.
 
-    :param raw: The composite descriptor bytes.
+    :param raw: A bytes or memoryview object containing the composite descriptor.
     :param common_descriptor: The common_descriptor if already deserialized or None.
 
     :returns: The blob descriptor.
@@ -81,7 +92,7 @@ def deserialize_blob_descriptor(
         raise ValueError("Invalid blob descriptor data length", len(raw))
 
     common_descriptor = common_descriptor or deserialize_common_resource_descriptor(raw)
-    extended_fields = struct.unpack(EXTENDED_DESCRIPTOR_FORMAT, raw[COMMON_DESCRIPTOR_SIZE:TOTAL_DESCRIPTOR_SIZE])
+    extended_fields = _EXTENDED_DESCRIPTOR_STRUCT.unpack_from(raw, COMMON_DESCRIPTOR_SIZE)
 
     return {
         **common_descriptor,  # type: ignore
@@ -1,8 +1,10 @@
 """
 GCF resource compression and decompression.
 """
+
 import zlib
 from enum import IntEnum, unique
+from typing import Iterable, Iterator, Union
 
 
 @unique
@@ -15,10 +17,33 @@ class SupercompressionScheme(IntEnum):
     TEST = 0xFFFF
 
 
+class IdentityCompressor:
+    """Identity streaming compressor.
+
+    Mirrors the interface of `zlib` compression objects, returning input data unchanged.
+    """
+
+    def compress(self, data):
+        """Return the input data."""
+
+        return data
+
+    def flush(self):
+        """Return an empty bytes object."""
+
+        return b""
+
+
+def make_compressor_deflate(level=6):
+    """Deflate streaming compressor factory."""
+
+    return zlib.compressobj(level, wbits=-15)
+
+
 def compress_deflate(data, level=6):
     """Deflate compression function."""
 
-    compressor = zlib.compressobj(level, wbits=-15)
+    compressor = make_compressor_deflate(level)
     compressed_data = compressor.compress(data)
     compressed_data += compressor.flush()
 
@@ -31,10 +56,16 @@ def decompress_deflate(data):
     return zlib.decompress(data, wbits=-15)
 
 
+def make_compressor_zlib(level=6):
+    """ZLib streaming compressor factory."""
+
+    return zlib.compressobj(level, wbits=15)
+
+
 def compress_zlib(data, level=6):
     """ZLib compression function."""
 
-    compressor = zlib.compressobj(level, wbits=15)
+    compressor = make_compressor_zlib(level)
 
     data = compressor.compress(data)
     data += compressor.flush()
@@ -48,6 +79,15 @@ def decompress_zlib(data):
     return zlib.decompress(data, wbits=15)
 
 
+def make_compressor_identity(level=None):  # pylint: disable=unused-argument
+    """Identity streaming compressor factory.
+
+    Any argument is ignored.
+    """
+
+    return IdentityCompressor()
+
+
 def compress_identity(data, level=None):  # pylint: disable=unused-argument
     """Identity compression function.
 
@@ -74,6 +114,16 @@ COMPRESSOR_TABLE = {
     SupercompressionScheme.TEST.value: (compress_deflate, decompress_deflate),
 }
 
+STREAM_COMPRESSOR_TABLE = {
+    SupercompressionScheme.NO_COMPRESSION.value: make_compressor_identity,
+    SupercompressionScheme.ZLIB.value: make_compressor_zlib,
+    SupercompressionScheme.DEFLATE.value: make_compressor_deflate,
+    SupercompressionScheme.TEST.value: make_compressor_deflate,
+}
+"""Streaming compressor factories of the schemes in `COMPRESSOR_TABLE` supporting streaming compression.
+
+Schemes without a factory are compressed in one go by `iter_compress()`."""
+
 
 def compress(data: bytes, supercompression_scheme: int) -> bytes:
     """Compress data by using one of the registered supercompression schemes.
@@ -92,7 +142,7 @@ def compress(data: bytes, supercompression_scheme: int) -> bytes:
     return compressor(data)
 
 
-def decompress(data: bytes, supercompression_scheme: int) -> bytes:
+def decompress(data: Union[bytes, memoryview], supercompression_scheme: int) -> Union[bytes, memoryview]:
     """Decompress data by using one of the registered supercompression schemes.
 
     :param data: The compressed data.
@@ -107,3 +157,68 @@ def decompress(data: bytes, supercompression_scheme: int) -> bytes:
         raise ValueError("Unknown supercompression scheme", supercompression_scheme) from exc
 
     return decompressor(data)
+
+
+def iter_compressed_chunks(chunks: Iterable[bytes], compressor) -> Iterator[bytes]:
+    """Compress a sequence of data chunks with a streaming compressor, yielding non-empty compressed data.
+
+    :param chunks: The uncompressed data chunks.
+    :param compressor: The streaming compressor object.
+
+    :returns: An iterator over the compressed data chunks.
+    """
+
+    for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk)
+
+        if compressed_chunk:
+            yield compressed_chunk
+
+    compressed_chunk = compressor.flush()
+
+    if compressed_chunk:
+        yield compressed_chunk
+
+
+def iter_compress(chunks: Iterable[bytes], supercompression_scheme: int) -> Iterator[bytes]:
+    """Compress a sequence of data chunks as a single stream, yielding compressed data as it is produced.
+
+    The concatenation of the yielded chunks is the same as the result of compressing the concatenation
+    of all the input chunks. Only one input chunk is processed at a time, unless the supercompression scheme
+    has no streaming compressor factory, in which case all the chunks are compressed at once. The
+    supercompression scheme is validated when this function is called, before any chunk is processed.
+
+    :param chunks: The uncompressed data chunks.
+    :param supercompression_scheme: The supercompression scheme ID.
+
+    :returns: An iterator over the compressed data chunks.
+    """
+
+    try:
+        compressor, _ = COMPRESSOR_TABLE[supercompression_scheme]
+    except KeyError as exc:
+        raise ValueError("Unknown supercompression scheme", supercompression_scheme) from exc
+
+    make_compressor = STREAM_COMPRESSOR_TABLE.get(supercompression_scheme)
+
+    if make_compressor is None:
+        compressed_data = compressor(b"".join(chunks))
+
+        return iter((compressed_data,) if compressed_data else ())
+
+    return iter_compressed_chunks(chunks, make_compressor())
+
+
+def compress_chunks(chunks: Iterable[bytes], supercompression_scheme: int) -> bytes:
+    """Compress a sequence of data chunks as a single stream.
+
+    The result is the same as compressing the concatenation of all the chunks, without
+    building the concatenated data first.
+
+    :param chunks: The uncompressed data chunks.
+    :param supercompression_scheme: The supercompression scheme ID.
+
+    :returns: The compressed data.
+    """
+
+    return b"".join(iter_compress(chunks, supercompression_scheme))
@@ -5,10 +5,13 @@ Functions in this module require the supplied file objects being seekable.
 """
 
 import io
-from functools import reduce
-from typing import BinaryIO, List, Tuple, Union, cast
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import BinaryIO, List, Optional, Tuple, Union, cast
 
 from .blob import BlobResourceDescriptor, deserialize_blob_descriptor, serialize_blob_descriptor
+from .compression import iter_compress
 from .header import (
     DEFAULT_VERSION,
     HEADER_SIZE,
@@ -32,14 +35,23 @@ from .texture import (
     deserialize_mip_level_data,
     deserialize_mip_level_descriptor,
     deserialize_texture_resource_descriptor,
-    serialize_mip_level_data,
     serialize_mip_level_descriptor,
     serialize_texture_resource_descriptor,
 )
-from .util import align_size
+from .util import make_aligner
 
 CompositeResourceDescriptor = Union[BlobResourceDescriptor, TextureResourceDescriptor, bytes]
 
+RESOURCE_ALIGNMENT = 8
+"""Alignment boundary, in bytes, of resources in padded containers."""
+
+MMAP_MIN_SIZE = 1 << 20
+"""Minimum payload size, in bytes, for which payloads are memory-mapped rather than read."""
+
+align_resource_offset = make_aligner(RESOURCE_ALIGNMENT)
+
+_ZERO_PADDING = bytes(RESOURCE_ALIGNMENT)
+
 
 def read_header(fileobj: BinaryIO, expected_version=DEFAULT_VERSION) -> Header:
     """Read a GCF header from a file object.
@@ -104,11 +116,51 @@ def skip_resource(fileobj: BinaryIO, common_descriptor: CommonResourceDescriptor
 
     extended_descriptor_size = common_descriptor["extension_size"]
     content_data_size = common_descriptor["content_size"]
-    total_skip_size = extended_descriptor_size + content_data_size
+    next_resource_offset = fileobj.tell() + extended_descriptor_size + content_data_size
+
+    if not ContainerFlags(header["flags"]) & ContainerFlags.UNPADDED:
+        next_resource_offset = align_resource_offset(next_resource_offset)
+
+    fileobj.seek(next_resource_offset)
+
+
+def skip_resources(fileobj: BinaryIO, count: int, header: Header):
+    """Skip a number of consecutive resources from a GCF file.
+
+    The file object must be positioned at the beginning of the first resource to skip.
+
+    :param fileobj: The file object.
+    :param count: The number of resources to skip.
+    :param header: The GCF file header.
+    """
+
+    if count <= 0:
+        return
+
+    for _ in repeat(None, count):
+        common_descriptor = read_common_resource_descriptor(fileobj)
+
+        skip_resource(fileobj, common_descriptor, header)
+
+
+def deserialize_custom_descriptor(raw: bytes, _common_descriptor: CommonResourceDescriptor) -> bytes:
+    """Deserialize a custom composite resource descriptor.
+
+    Custom descriptors are returned as-is.
+
+    :param raw: The composite descriptor bytes.
+    :param _common_descriptor: The common descriptor. Ignored.
 
-    fileobj.seek(total_skip_size, io.SEEK_CUR)
+    :returns: The composite descriptor bytes.
+    """
+
+    return raw
 
-    skip_padding(fileobj, header)
+
+COMPOSITE_DESCRIPTOR_DESERIALIZERS = {
+    ResourceType.BLOB.value: deserialize_blob_descriptor,
+    ResourceType.TEXTURE.value: deserialize_texture_resource_descriptor,
+}
 
 
 def read_composite_descriptor(fileobj: BinaryIO) -> CompositeResourceDescriptor:
@@ -128,18 +180,15 @@ def read_composite_descriptor(fileobj: BinaryIO) -> CompositeResourceDescriptor:
     raw_extended_descriptor = fileobj.read(extended_descriptor_size)
     full_descriptor = raw_common_descriptor + raw_extended_descriptor
 
-    deserializers = {
-        ResourceType.BLOB.value: deserialize_blob_descriptor,
-        ResourceType.TEXTURE.value: deserialize_texture_resource_descriptor,
-    }
+    deserialize = COMPOSITE_DESCRIPTOR_DESERIALIZERS.get(resource_type, deserialize_custom_descriptor)
+
+    return cast(CompositeResourceDescriptor, deserialize(full_descriptor, common_descriptor))
 
-    def nop_deserializer(raw: bytes, _common_descriptor: CommonResourceDescriptor) -> bytes:
-        return raw
 
-    return cast(
-        CompositeResourceDescriptor,
-        deserializers.get(resource_type, nop_deserializer)(full_descriptor, common_descriptor),
-    )
+COMPOSITE_DESCRIPTOR_SERIALIZERS = {
+    ResourceType.BLOB.value: serialize_blob_descriptor,
+    ResourceType.TEXTURE.value: serialize_texture_resource_descriptor,
+}
 
 
 def write_composite_resource_descriptor(fileobj: BinaryIO, descriptor: CompositeResourceDescriptor):
@@ -153,24 +202,15 @@ def write_composite_resource_descriptor(fileobj: BinaryIO, descriptor: Composite
     """
 
     if isinstance(descriptor, bytes):
+        fileobj.write(descriptor)
+        return
 
-        def serialize(data: bytes) -> bytes:
-            return data
-
-    else:
-        serializer_map = {
-            ResourceType.TEXTURE.value: serialize_texture_resource_descriptor,
-            ResourceType.BLOB.value: serialize_blob_descriptor,
-        }
-
-        try:
-            serialize = serializer_map[descriptor["type"]]  # type: ignore
-        except KeyError as exc:
-            raise ValueError("Unknown descriptor object", descriptor) from exc
-
-    raw_descriptor = serialize(descriptor)  # type: ignore
+    try:
+        serialize = COMPOSITE_DESCRIPTOR_SERIALIZERS[descriptor["type"]]
+    except KeyError as exc:
+        raise ValueError("Unknown descriptor object", descriptor) from exc
 
-    fileobj.write(raw_descriptor)
+    fileobj.write(serialize(descriptor))  # type: ignore
 
 
 def skip_padding(fileobj: BinaryIO, header: Header):
@@ -180,13 +220,13 @@ def skip_padding(fileobj: BinaryIO, header: Header):
     :param header: The GCF file header.
     """
 
-    is_alignment_required = not ContainerFlags(header["flags"]) & ContainerFlags.UNPADDED
+    if ContainerFlags(header["flags"]) & ContainerFlags.UNPADDED:
+        return
 
-    if is_alignment_required:
-        current_offset = fileobj.tell()
-        aligned_offset = align_size(current_offset, 8)
+    current_offset = fileobj.tell()
+    aligned_offset = align_resource_offset(current_offset)
 
-        fileobj.seek(aligned_offset)
+    fileobj.seek(aligned_offset)
 
 
 def write_padding(fileobj: BinaryIO, header: Header):
@@ -199,12 +239,10 @@ def write_padding(fileobj: BinaryIO, header: Header):
     if header["flags"] & ContainerFlags.UNPADDED:
         return
 
-    origin = fileobj.tell()
-    aligned = align_size(origin, 8)
-    padding_size = aligned - origin
-    padding = b"\0" * padding_size
+    padding_size = -fileobj.tell() & (RESOURCE_ALIGNMENT - 1)
 
-    fileobj.write(padding)
+    if padding_size:
+        fileobj.write(_ZERO_PADDING[:padding_size])
 
 
 def write_mip_level_descriptor(fileobj: BinaryIO, descriptor: MipLevelDescriptor):
@@ -228,11 +266,112 @@ def read_mip_level_descriptor(fileobj: BinaryIO) -> MipLevelDescriptor:
     return deserialize_mip_level_descriptor(raw)
 
 
+def skip_mip_levels(fileobj: BinaryIO, count: int):
+    """Skip a number of consecutive mip levels of a texture resource.
+
+    Only the mip level descriptors are read, mip level data is skipped over.
+
+    :param fileobj: The file object.
+    :param count: The number of mip levels to skip.
+    """
+
+    for _ in repeat(None, count):
+        level_descriptor = read_mip_level_descriptor(fileobj)
+
+        fileobj.seek(level_descriptor["compressed_size"], io.SEEK_CUR)
+
+
+def map_payload(fileobj: BinaryIO, size: int) -> Optional[memoryview]:
+    """Memory-map a payload of a given size starting at the current file position.
+
+    Only file objects backed by an OS file, as returned by `open()`, are mapped: other file objects, e.g.
+    compressed or archive member streams, may expose a file descriptor whose content does not match
+    the stream content. Only the region containing the payload is mapped.
+
+    The mapping is only referenced by the returned view and is closed once the view and all the views derived
+    from it are released. The file must not be truncated or modified in the meantime: doing so may crash the
+    process when accessing the view or silently change its content.
+
+    :param fileobj: The file object.
+    :param size: The payload size.
+
+    :returns: A read-only view over the mapped payload or None if the payload cannot be mapped.
+    """
+
+    if size <= 0 or not isinstance(getattr(fileobj, "raw", fileobj), io.FileIO):
+        return None
+
+    offset = fileobj.tell()
+    map_offset = offset - offset % mmap.ALLOCATIONGRANULARITY
+
+    try:
+        fileobj.flush()
+        mapping = mmap.mmap(fileobj.fileno(), offset - map_offset + size, access=mmap.ACCESS_READ, offset=map_offset)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+    fileobj.seek(offset + size)
+
+    return memoryview(mapping)[offset - map_offset :]
+
+
+def read_payload(fileobj: BinaryIO, size: int) -> memoryview:
+    """Read a payload of a given size from a file object.
+
+    When the payload is at least `MMAP_MIN_SIZE` bytes long and can be memory-mapped (see `map_payload()`),
+    the returned object is a read-only view over the mapping and pages are loaded on demand. Otherwise
+    the payload is read directly into a newly allocated buffer, through `readinto()` when the file object
+    provides it.
+
+    A memory-mapped payload has the same lifetime constraints as the views returned by `map_payload()`.
+
+    :param fileobj: The file object.
+    :param size: The payload size.
+
+    :returns: The payload data.
+    """
+
+    if size >= MMAP_MIN_SIZE:
+        mapped_payload = map_payload(fileobj, size)
+
+        if mapped_payload is not None:
+            return mapped_payload
+
+    readinto = getattr(fileobj, "readinto", None)
+
+    if readinto is None:
+        payload = memoryview(fileobj.read(size))
+        read_size = len(payload)
+    else:
+        payload = memoryview(bytearray(size))
+        read_size = readinto(payload)
+
+    if read_size != size:
+        raise ValueError("Unexpected end of payload data", read_size)
+
+    return payload
+
+
+def unmap_layers(layers: List[memoryview]) -> List[memoryview]:
+    """Copy into memory the layers that are views over a memory-mapped file.
+
+    :param layers: The list of layers.
+
+    :returns: The list of layers, none of which is backed by a memory mapping.
+    """
+
+    return [memoryview(layer.tobytes()) if isinstance(layer.obj, mmap.mmap) else layer for layer in layers]
+
+
 def read_mip_level(
     fileobj: BinaryIO, texture_descriptor: TextureResourceDescriptor
-) -> Tuple[MipLevelDescriptor, List[bytes]]:
+) -> Tuple[MipLevelDescriptor, List[memoryview]]:
     """Read a mip level and return its data.
 
+    The mip level data may be read through a memory mapping (see `read_payload()`), but the returned layers
+    never reference it: layers that would be views over the mapping, e.g. uncompressed ones, are copied into
+    memory, so they stay valid if the file is later modified.
+
     :param fileobj: The file object.
     :param texture_descriptor: The texture resource descriptor object.
 
@@ -240,9 +379,69 @@ def read_mip_level(
     """
 
     level_descriptor = read_mip_level_descriptor(fileobj)
-    raw_layers = fileobj.read(level_descriptor["compressed_size"])
+    raw_layers = read_payload(fileobj, level_descriptor["compressed_size"])
+
+    return level_descriptor, unmap_layers(deserialize_mip_level_data(raw_layers, texture_descriptor))
+
 
-    return level_descriptor, deserialize_mip_level_data(raw_layers, texture_descriptor)
+def read_mip_levels(
+    fileobj: BinaryIO, texture_descriptor: TextureResourceDescriptor, executor: Optional[ThreadPoolExecutor] = None
+) -> List[Tuple[MipLevelDescriptor, List[memoryview]]]:
+    """Read all the mip levels of a texture resource and return their data.
+
+    The whole texture content is read at once and mip levels are parsed in place from it. As with
+    `read_mip_level()`, the returned layers never reference a memory mapping of the file.
+
+    When a thread pool executor is provided, mip level data is decompressed concurrently on its threads, as the
+    standard supercompression schemes release the GIL while decompressing. Process-based executors are not
+    supported: mip level data is passed to the workers as views over the texture content, which cannot be pickled.
+
+    :param fileobj: The file object.
+    :param texture_descriptor: The texture resource descriptor object.
+    :param executor: The thread pool executor to decompress mip level data on or None to decompress serially.
+
+    :returns: A list of tuples, one per mip level, containing the mip level descriptor and the list of
+        uncompressed layers.
+    """
+
+    content = read_payload(fileobj, texture_descriptor["content_size"])
+    content_size = len(content)
+    level_descriptors = []
+    raw_levels = []
+    offset = 0
+
+    for _ in range(texture_descriptor["mip_level_count"]):
+        level_descriptor = deserialize_mip_level_descriptor(content[offset : offset + MIP_LEVEL_SIZE])
+        data_begin = offset + MIP_LEVEL_SIZE
+        offset = data_begin + level_descriptor["compressed_size"]
+
+        if offset > content_size:
+            raise ValueError("Invalid mip level data size", level_descriptor["compressed_size"])
+
+        level_descriptors.append(level_descriptor)
+        raw_levels.append(content[data_begin:offset])
+
+    def deserialize(raw_level: memoryview) -> List[memoryview]:
+        return unmap_layers(deserialize_mip_level_data(raw_level, texture_descriptor))
+
+    level_layers = executor.map(deserialize, raw_levels) if executor else map(deserialize, raw_levels)
+
+    return list(zip(level_descriptors, level_layers))
+
+
+def is_rewritable(fileobj: BinaryIO) -> bool:
+    """Tell whether data already written to a file object can be overwritten in place.
+
+    Only in-memory buffers and OS files, as returned by `open()`, not opened in append mode are rewritable.
+
+    :param fileobj: The file object.
+
+    :returns: True if the file object is rewritable, False otherwise.
+    """
+
+    raw = getattr(fileobj, "raw", fileobj)
+
+    return isinstance(raw, io.BytesIO) or (isinstance(raw, io.FileIO) and "a" not in raw.mode)
 
 
 def write_mip_level(
@@ -253,19 +452,42 @@ def write_mip_level(
     This function ignores the `compressed_size` and `uncompressed_size` mip level descriptor fields and replaces
     their value when writing to file. `mip_level_descriptor` is not updated by this function.
 
+    When the file object is rewritable (see `is_rewritable()`), layers are compressed and written to file one at
+    a time and the mip level descriptor is written last, once the compressed size is known. Otherwise, the whole
+    mip level data is compressed in memory before writing the descriptor.
+
     :param fileobj: The file object.
     :param supercompression_scheme: The supercompression scheme to compress the data.
     :param mip_level_descriptor: The mip level descriptor object.
     :param layers: The list of uncompressed layer data, one entry per layer.
     """
 
-    mip_level_descriptor = mip_level_descriptor.copy()
-    raw_layers = serialize_mip_level_data(layers, supercompression_scheme)
+    compressed_chunks = iter_compress(layers, supercompression_scheme)
 
     # Override descriptor's data.
-    mip_level_descriptor["compressed_size"] = len(raw_layers)
-    mip_level_descriptor["uncompressed_size"] = reduce(lambda total, layer: total + len(layer), layers, 0)
+    mip_level_descriptor = mip_level_descriptor.copy()
+    mip_level_descriptor["uncompressed_size"] = sum(map(len, layers))
 
-    write_mip_level_descriptor(fileobj, mip_level_descriptor)
+    if not is_rewritable(fileobj):
+        compressed_data = b"".join(compressed_chunks)
+        mip_level_descriptor["compressed_size"] = len(compressed_data)
 
-    fileobj.write(raw_layers)
+        write_mip_level_descriptor(fileobj, mip_level_descriptor)
+        fileobj.write(compressed_data)
+        return
+
+    descriptor_offset = fileobj.tell()
+    compressed_size = 0
+
+    fileobj.seek(MIP_LEVEL_SIZE, io.SEEK_CUR)
+
+    for compressed_chunk in compressed_chunks:
+        fileobj.write(compressed_chunk)
+        compressed_size += len(compressed_chunk)
+
+    end_offset = fileobj.tell()
+    mip_level_descriptor["compressed_size"] = compressed_size
+
+    fileobj.seek(descriptor_offset)
+    write_mip_level_descriptor(fileobj, mip_level_descriptor)
+    fileobj.seek(end_offset)
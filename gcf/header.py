@@ -4,13 +4,15 @@ Header serialization.
 
 import struct
 from enum import Flag, auto
-from typing import TypedDict
+from typing import TypedDict, Union
 
 DEFAULT_VERSION = 3
 MAGIC_PREFIX = b"GC"
 HEADER_FORMAT = "=I2H"
 HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
 
+_HEADER_STRUCT = struct.Struct(HEADER_FORMAT)
+
 
 class ContainerFlags(Flag):
     """Container flags."""
@@ -18,6 +20,9 @@ class ContainerFlags(Flag):
     UNPADDED = auto()
 
 
+_CONTAINER_FLAGS_TABLE = {flags.value: flags for flags in (ContainerFlags(0), ContainerFlags.UNPADDED)}
+
+
 class Header(TypedDict):
     """GCF file header."""
 
@@ -32,10 +37,13 @@ def make_magic_number(version: int = DEFAULT_VERSION) -> int:
     if version > 99:
         raise ValueError("Version must be < 100", version)
 
+    if version < 0:
+        raise ValueError("Version must be >= 0", version)
+
     version_bytes = str(version).zfill(2).encode("utf-8")
     magic_bytes = MAGIC_PREFIX + version_bytes
 
-    return struct.unpack("<I", magic_bytes)[0]
+    return int.from_bytes(magic_bytes, "little")
 
 
 def serialize_header(header: Header) -> bytes:
@@ -46,13 +54,13 @@ def serialize_header(header: Header) -> bytes:
     :returns: A bytes object containing the serialized representation of the header.
     """
 
-    return struct.pack(HEADER_FORMAT, header["magic"], header["resource_count"], header["flags"].value)
+    return _HEADER_STRUCT.pack(header["magic"], header["resource_count"], header["flags"].value)
 
 
-def deserialize_header(raw: bytes) -> Header:
+def deserialize_header(raw: Union[bytes, memoryview]) -> Header:
     """Serialize a GCF file header.
 
-    :param raw: A bytes object containing the serialized representation of the header.
+    :param raw: A bytes or memoryview object containing the serialized representation of the header.
 
     :returns: A header object.
     """
@@ -60,6 +68,11 @@ def deserialize_header(raw: bytes) -> Header:
     if not len(raw) == HEADER_SIZE:
         raise ValueError("Invalid header data size", len(raw))
 
-    fields = struct.unpack(HEADER_FORMAT, raw)
+    fields = _HEADER_STRUCT.unpack(raw)
+
+    flags = _CONTAINER_FLAGS_TABLE.get(fields[2])
+
+    if flags is None:
+        raise ValueError("Invalid container flags", fields[2])
 
-    return {"magic": fields[0], "resource_count": fields[1], "flags": ContainerFlags(fields[2])}
+    return {"magic": fields[0], "resource_count": fields[1], "flags": flags}
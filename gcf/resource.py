@@ -4,11 +4,13 @@ Common resource descriptor serialization.
 
 import struct
 from enum import IntEnum, unique
-from typing import TypedDict
+from typing import TypedDict, Union
 
 COMMON_DESCRIPTOR_FORMAT = "=3I2H"
 COMMON_DESCRIPTOR_SIZE = struct.calcsize(COMMON_DESCRIPTOR_FORMAT)
 
+_COMMON_DESCRIPTOR_STRUCT = struct.Struct(COMMON_DESCRIPTOR_FORMAT)
+
 
 @unique
 class ResourceType(IntEnum):
@@ -37,8 +39,7 @@ def serialize_common_resource_descriptor(descriptor: CommonResourceDescriptor) -
     :returns: A bytes object containing the serialized descriptor.
     """
 
-    return struct.pack(
-        COMMON_DESCRIPTOR_FORMAT,
+    return _COMMON_DESCRIPTOR_STRUCT.pack(
         descriptor["type"],
         descriptor["format"],
         descriptor["content_size"],
@@ -47,10 +48,10 @@ def serialize_common_resource_descriptor(descriptor: CommonResourceDescriptor) -
     )
 
 
-def deserialize_common_resource_descriptor(raw: bytes) -> CommonResourceDescriptor:
+def deserialize_common_resource_descriptor(raw: Union[bytes, memoryview]) -> CommonResourceDescriptor:
     """Deserialize a common resource descriptor.
 
-    :param raw: A bytes object containing the serialized descriptor.
+    :param raw: A bytes or memoryview object containing the serialized descriptor.
 
     :returns: The descriptor object.
     """
@@ -58,7 +59,7 @@ def deserialize_common_resource_descriptor(raw: bytes) -> CommonResourceDescript
     if len(raw) < COMMON_DESCRIPTOR_SIZE:
         raise ValueError("Invalid common resource descriptor data size", len(raw))
 
-    fields = struct.unpack(COMMON_DESCRIPTOR_FORMAT, raw[:COMMON_DESCRIPTOR_SIZE])
+    fields = _COMMON_DESCRIPTOR_STRUCT.unpack_from(raw)
 
     return {
         "type": fields[0],
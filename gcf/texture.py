@@ -4,15 +4,15 @@ Texture resource serialization.
 
 import struct
 from enum import IntFlag
-from typing import List, Optional, TypedDict
+from typing import List, Literal, Optional, TypedDict, Union, overload
 
-from .compression import compress, decompress
+from .compression import compress_chunks, decompress
 from .resource import (
+    COMMON_DESCRIPTOR_FORMAT,
     COMMON_DESCRIPTOR_SIZE,
     CommonResourceDescriptor,
     ResourceType,
     deserialize_common_resource_descriptor,
-    serialize_common_resource_descriptor,
 )
 
 EXTENDED_DESCRIPTOR_FORMAT = "=3H2BHIH"
@@ -22,6 +22,12 @@ TOTAL_DESCRIPTOR_SIZE = COMMON_DESCRIPTOR_SIZE + EXTENDED_DESCRIPTOR_SIZE
 MIP_LEVEL_FORMAT = "=6I"
 MIP_LEVEL_SIZE = struct.calcsize(MIP_LEVEL_FORMAT)
 
+_EXTENDED_DESCRIPTOR_STRUCT = struct.Struct(EXTENDED_DESCRIPTOR_FORMAT)
+_TOTAL_DESCRIPTOR_STRUCT = struct.Struct(COMMON_DESCRIPTOR_FORMAT + EXTENDED_DESCRIPTOR_FORMAT[1:])
+_MIP_LEVEL_STRUCT = struct.Struct(MIP_LEVEL_FORMAT)
+
+_RESOURCE_TYPE_TEXTURE = ResourceType.TEXTURE.value
+
 
 class TextureFlags(IntFlag):
     """Texture flags."""
@@ -31,6 +37,9 @@ class TextureFlags(IntFlag):
     TEXTURE_3D = 0x0007  # pylint: disable=implicit-flag-alias
 
 
+_TEXTURE_FLAGS_TABLE = {flag.value: flag for flag in TextureFlags.__members__.values()}
+
+
 class TextureResourceDescriptor(CommonResourceDescriptor):
     """A texture extended descriptor object."""
 
@@ -69,7 +78,7 @@ def make_texture_resource_descriptor(
     """Make a texture resource descriptor."""
 
     return {
-        "type": ResourceType.TEXTURE.value,
+        "type": _RESOURCE_TYPE_TEXTURE,
         "format": format_,
         "content_size": content_size,
         "extension_size": EXTENDED_DESCRIPTOR_SIZE,
@@ -84,6 +93,19 @@ def make_texture_resource_descriptor(
     }
 
 
+def decode_texture_flags(raw_flags: int) -> TextureFlags:
+    """Decode raw texture flags.
+
+    :param raw_flags: The flags as stored in the texture descriptor.
+
+    :returns: The texture flags.
+    """
+
+    flags = _TEXTURE_FLAGS_TABLE.get(raw_flags)
+
+    return TextureFlags(raw_flags) if flags is None else flags
+
+
 def serialize_mip_level_descriptor(descriptor: MipLevelDescriptor) -> bytes:
     """Serialize a mip level descriptor.
 
@@ -92,8 +114,7 @@ def serialize_mip_level_descriptor(descriptor: MipLevelDescriptor) -> bytes:
     :returns: A bytes object containing the serialized descriptor.
     """
 
-    return struct.pack(
-        MIP_LEVEL_FORMAT,
+    return _MIP_LEVEL_STRUCT.pack(
         descriptor["compressed_size"],
         descriptor["uncompressed_size"],
         descriptor["row_stride"],
@@ -103,10 +124,10 @@ def serialize_mip_level_descriptor(descriptor: MipLevelDescriptor) -> bytes:
     )
 
 
-def deserialize_mip_level_descriptor(raw: bytes) -> MipLevelDescriptor:
+def deserialize_mip_level_descriptor(raw: Union[bytes, memoryview]) -> MipLevelDescriptor:
     """Deserialize a mip level descriptor.
 
-    :param raw: A bytes object containing the serialized descriptor.
+    :param raw: A bytes or memoryview object containing the serialized descriptor.
 
     :returns: The descriptor object.
     """
@@ -114,7 +135,7 @@ def deserialize_mip_level_descriptor(raw: bytes) -> MipLevelDescriptor:
     if len(raw) < MIP_LEVEL_SIZE:
         raise ValueError("Invalid mip level data size", len(raw))
 
-    fields = struct.unpack(MIP_LEVEL_FORMAT, raw)
+    fields = _MIP_LEVEL_STRUCT.unpack_from(raw)
 
     return {
         "compressed_size": fields[0],
@@ -133,10 +154,12 @@ def serialize_texture_resource_descriptor(descriptor: TextureResourceDescriptor)
     :returns: A bytes object containing the serialized descriptor.
     """
 
-    common_data = serialize_common_resource_descriptor(descriptor)
-
-    extended_data = struct.pack(
-        EXTENDED_DESCRIPTOR_FORMAT,
+    return _TOTAL_DESCRIPTOR_STRUCT.pack(
+        descriptor["type"],
+        descriptor["format"],
+        descriptor["content_size"],
+        descriptor["extension_size"],
+        descriptor["supercompression_scheme"],
         descriptor["base_width"],
         descriptor["base_height"],
         descriptor["base_depth"],
@@ -147,15 +170,13 @@ def serialize_texture_resource_descriptor(descriptor: TextureResourceDescriptor)
         0,
     )
 
-    return common_data + extended_data
-
 
 def deserialize_texture_resource_descriptor(
-    raw: bytes, common_descriptor: Optional[CommonResourceDescriptor] = None
+    raw: Union[bytes, memoryview], common_descriptor: Optional[CommonResourceDescriptor] = None
 ) -> TextureResourceDescriptor:
     """Deserialize a texture extended resource descriptor.
 
-    :param raw: A bytes object containing the serialized descriptor.
+    :param raw: A bytes or memoryview object containing the serialized descriptor.
 
     :returns: The descriptor object.
     """
@@ -164,7 +185,7 @@ def deserialize_texture_resource_descriptor(
         raise ValueError("Invalid texture descriptor data size", len(raw))
 
     common_descriptor = common_descriptor or deserialize_common_resource_descriptor(raw)
-    extended_fields = struct.unpack(EXTENDED_DESCRIPTOR_FORMAT, raw[COMMON_DESCRIPTOR_SIZE:TOTAL_DESCRIPTOR_SIZE])
+    extended_fields = _EXTENDED_DESCRIPTOR_STRUCT.unpack_from(raw, COMMON_DESCRIPTOR_SIZE)
 
     return {
         **common_descriptor,  # type: ignore
@@ -173,23 +194,42 @@ def deserialize_texture_resource_descriptor(
         "base_depth": extended_fields[2],
         "layer_count": extended_fields[3],
         "mip_level_count": extended_fields[4],
-        "flags": TextureFlags(extended_fields[5]),
+        "flags": decode_texture_flags(extended_fields[5]),
         "texture_group": extended_fields[6],
     }
 
 
-def deserialize_mip_level_data(raw: bytes, descriptor: TextureResourceDescriptor) -> List[bytes]:
+@overload
+def deserialize_mip_level_data(
+    raw: Union[bytes, memoryview], descriptor: TextureResourceDescriptor, copy: Literal[False] = False
+) -> List[memoryview]: ...
+
+
+@overload
+def deserialize_mip_level_data(
+    raw: Union[bytes, memoryview], descriptor: TextureResourceDescriptor, copy: Literal[True]
+) -> List[bytes]: ...
+
+
+def deserialize_mip_level_data(
+    raw: Union[bytes, memoryview], descriptor: TextureResourceDescriptor, copy: bool = False
+) -> Union[List[memoryview], List[bytes]]:
     """Deserialize a texture mip level data.
 
-    :param raw: A bytes object containing the serialized data.
+    By default, the returned layers are read-only views over the decompressed mip level data and no per-layer
+    copy is made. Pass `copy=True` to get independent bytes objects instead.
+
+    :param raw: A bytes or memoryview object containing the serialized data.
     :param descriptor: The texture resource descriptor.
+    :param copy: Whether to return a copy of each layer data rather than a view.
 
-    :returns: A list of bytes objects, each representing the data of a given texture layer.
+    :returns: A list of memoryview (or bytes, if `copy` is set) objects, each representing the data of a given
+        texture layer.
     """
 
     supercompression_scheme = descriptor["supercompression_scheme"]
     layer_count = descriptor["layer_count"]
-    decompressed_level = decompress(raw, supercompression_scheme)
+    decompressed_level = memoryview(decompress(raw, supercompression_scheme)).toreadonly()
     total_decompressed_size = len(decompressed_level)
     layer_size = total_decompressed_size // layer_count
 
@@ -201,6 +241,9 @@ def deserialize_mip_level_data(raw: bytes, descriptor: TextureResourceDescriptor
 
         layers.append(decompressed_level[layer_data_begin:layer_data_end])
 
+    if copy:
+        return [layer.tobytes() for layer in layers]
+
     return layers
 
 
@@ -212,6 +255,5 @@ def serialize_mip_level_data(layers: List[bytes], supercompression_scheme: int)
 
     :returns: A bytes object containing the serialized data.
     """
-    layer_seq = b"".join(layers)
 
-    return compress(layer_seq, supercompression_scheme)
+    return compress_chunks(layers, supercompression_scheme)
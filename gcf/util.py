@@ -2,15 +2,20 @@
 Utilities.
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Callable, List, Tuple
 
 
+@lru_cache(maxsize=1024)
 def compute_mip_level_size(mip_level: int, base_width: int, base_height: int, base_depth: int) -> Tuple[int, int, int]:
     """Compute the mip level size.
 
     Compute the factor used to multiply the base image size to obtain the
     given mip level size.
 
+    Sizes are rounded half to even. See `compute_mip_level_size_vk` for the
+    truncating convention mandated by the Vulkan specification.
+
     :param mip_level: The desired mip level.
     :param base_width: The width of the base image size.
     :param base_height: The height of the base image size.
@@ -19,12 +24,87 @@ def compute_mip_level_size(mip_level: int, base_width: int, base_height: int, ba
     :returns: A tuple containing the mip level width, height and depth.
     """
 
-    mip_level_resize_factor = compute_mip_level_resize_factor(mip_level)
+    if mip_level < 0:
+        mip_level_resize_factor = compute_mip_level_resize_factor(mip_level)
+
+        return (
+            round(max(1, base_width * mip_level_resize_factor)),
+            round(max(1, base_height * mip_level_resize_factor)),
+            round(max(1, base_depth * mip_level_resize_factor)),
+        )
+
+    return (
+        shift_mip_level_size(base_width, mip_level),
+        shift_mip_level_size(base_height, mip_level),
+        shift_mip_level_size(base_depth, mip_level),
+    )
+
+
+def compute_mip_level_size_vk(
+    mip_level: int, base_width: int, base_height: int, base_depth: int
+) -> Tuple[int, int, int]:
+    """Compute the mip level size following the Vulkan convention.
+
+    Each dimension is computed as ``max(1, base_size >> mip_level)``, truncating rather than rounding,
+    as mandated by the Vulkan and OpenGL specifications. This may differ from `compute_mip_level_size`
+    for non power-of-two sizes (e.g. 35 at mip level 1 is 17 rather than 18).
+
+    :param mip_level: The desired mip level. Must not be negative.
+    :param base_width: The width of the base image size.
+    :param base_height: The height of the base image size.
+    :param base_depth: The depth of the base image size.
+
+    :returns: A tuple containing the mip level width, height and depth.
+    """
+
+    return max(1, base_width >> mip_level), max(1, base_height >> mip_level), max(1, base_depth >> mip_level)
+
+
+def compute_mip_chain_sizes(
+    mip_level_count: int, base_width: int, base_height: int, base_depth: int
+) -> List[Tuple[int, int, int]]:
+    """Compute the size of all the levels of a mip chain.
+
+    :param mip_level_count: The number of mip levels in the chain.
+    :param base_width: The width of the base image size.
+    :param base_height: The height of the base image size.
+    :param base_depth: The depth of the base image size.
+
+    :returns: A list containing the width, height and depth of each mip level, starting from the base level.
+    """
+
+    return [
+        (
+            shift_mip_level_size(base_width, mip_level),
+            shift_mip_level_size(base_height, mip_level),
+            shift_mip_level_size(base_depth, mip_level),
+        )
+        for mip_level in range(mip_level_count)
+    ]
 
-    def scale_size(base_size: int) -> int:
-        return round(max(1, base_size * mip_level_resize_factor))
 
-    return scale_size(base_width), scale_size(base_height), scale_size(base_depth)
+def shift_mip_level_size(base_size: int, mip_level: int) -> int:
+    """Scale a base image size to a given non-negative mip level using integer arithmetic only.
+
+    The result is the base size divided by 2 to the power of the mip level, rounded half to even
+    and clamped to a minimum of 1.
+
+    :param base_size: The base image size.
+    :param mip_level: The desired mip level.
+
+    :returns: The mip level size.
+    """
+
+    size = base_size >> mip_level
+
+    if mip_level:
+        remainder = base_size & ((1 << mip_level) - 1)
+        half = 1 << (mip_level - 1)
+
+        if remainder > half or (remainder == half and size & 1):
+            size += 1
+
+    return max(1, size)
 
 
 def compute_mip_level_resize_factor(mip_level: int):
@@ -34,19 +114,49 @@ def compute_mip_level_resize_factor(mip_level: int):
     given mip level size.
     """
 
-    return 0.5**mip_level
+    if mip_level < 0:
+        return 0.5**mip_level
+
+    return 1 / (1 << mip_level)
 
 
 def align_size(orig_size: int, alignment: int) -> int:
     """Align a size value to a given boundary.
 
+    Power of 2 alignments are computed with bitwise operations only, other
+    alignments fall back to integer division. Use `make_aligner` when aligning
+    repeatedly to the same power of 2 boundary.
+
     :param orig_size: The original size to align.
-    :param alignment: The alignment boundary to align to.
+    :param alignment: The alignment boundary to align to. Must be positive.
 
     :returns: The input size, aligned according to the given constraint.
     """
 
-    assert not alignment & (alignment - 1)  # must be power of 2
     mask = alignment - 1
 
-    return (orig_size + mask) & ~mask
+    if not alignment & mask:
+        return (orig_size + mask) & ~mask
+
+    return -(-orig_size // alignment) * alignment
+
+
+def make_aligner(alignment: int) -> Callable[[int], int]:
+    """Make a function aligning size values to a given boundary.
+
+    The alignment is validated once, when the function is created.
+
+    :param alignment: The alignment boundary to align to. Must be a power of 2.
+
+    :returns: A function taking a size value and returning it aligned according to the given constraint.
+    """
+
+    if alignment <= 0 or alignment & (alignment - 1):
+        raise ValueError("Alignment must be a power of 2", alignment)
+
+    mask = alignment - 1
+
+    def align(orig_size: int) -> int:
+        return (orig_size + mask) & ~mask
+
+    return align
@@ -41,6 +41,9 @@ CUSTOM_RESOURCE_DESCRIPTOR = (
     + b"123"
 )
 
+BLOB_RESOURCE_DATA = b"\xfe" * 100
+CUSTOM_RESOURCE_DATA = b"\xfb" * 123
+
 
 def two_resource_gcf_file(padding_enabled: bool) -> BinaryIO:
     magic = make_magic_number()
@@ -53,10 +56,10 @@ def two_resource_gcf_file(padding_enabled: bool) -> BinaryIO:
 
     file.write_header(fileobj, header)
     file.write_composite_resource_descriptor(fileobj, BLOB_RESOURCE_DESCRIPTOR)
-    fileobj.write(b"\xfe" * 100)
+    fileobj.write(BLOB_RESOURCE_DATA)
     file.write_padding(fileobj, header)
     file.write_composite_resource_descriptor(fileobj, CUSTOM_RESOURCE_DESCRIPTOR)
-    fileobj.write(b"\xfb" * 123)
+    fileobj.write(CUSTOM_RESOURCE_DATA)
     fileobj.seek(0)
 
     return fileobj
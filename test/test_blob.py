@@ -23,6 +23,14 @@ def test_serialize_deserialize_blob_descriptor():
     assert actual_descriptor == expected_descriptor
 
 
+def test_deserialize_blob_descriptor_memoryview():
+    expected_descriptor = blob.make_blob_resource_descriptor(100, 200, SupercompressionScheme.TEST.value)
+    raw = memoryview(blob.serialize_blob_descriptor(expected_descriptor))
+    actual_descriptor = blob.deserialize_blob_descriptor(raw)
+
+    assert actual_descriptor == expected_descriptor
+
+
 def test_serialize_blob_descriptor():
     """Test against spec."""
 
@@ -1,6 +1,6 @@
 import pytest
 
-from gcf.compression import COMPRESSOR_TABLE, compress, decompress
+from gcf.compression import COMPRESSOR_TABLE, compress, compress_chunks, compress_zlib, decompress, decompress_zlib
 
 
 @pytest.mark.parametrize("supercompression_scheme", tuple(COMPRESSOR_TABLE.keys()))
@@ -10,3 +10,25 @@ def test_compress_cycle(supercompression_scheme):
     decompressed_data = decompress(compressed_data, supercompression_scheme)
 
     assert decompressed_data == original_data
+
+
+@pytest.mark.parametrize("supercompression_scheme", tuple(COMPRESSOR_TABLE.keys()))
+def test_compress_chunks(supercompression_scheme):
+    original_data = bytes(range(128))
+    chunks = [original_data[:50], original_data[50:100], original_data[100:]]
+    compressed_data = compress_chunks(chunks, supercompression_scheme)
+    decompressed_data = decompress(compressed_data, supercompression_scheme)
+
+    assert decompressed_data == original_data
+
+
+def test_compress_chunks_without_stream_compressor(monkeypatch):
+    scheme = 0x1234
+    monkeypatch.setitem(COMPRESSOR_TABLE, scheme, (compress_zlib, decompress_zlib))
+
+    original_data = bytes(range(128))
+    chunks = [original_data[:50], original_data[50:]]
+    compressed_data = compress_chunks(chunks, scheme)
+
+    assert compressed_data == compress(original_data, scheme)
+    assert decompress(compressed_data, scheme) == original_data
@@ -1,5 +1,9 @@
+import gzip
 import io
-from typing import BinaryIO
+import mmap
+import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, cast
 
 import pytest
 
@@ -12,7 +16,6 @@ from gcf import (
     ResourceType,
     SupercompressionScheme,
     TextureFlags,
-    TextureResourceDescriptor,
     file,
     make_magic_number,
     make_texture_resource_descriptor,
@@ -86,6 +89,40 @@ def test_skip_resource(padding_enabled):
     assert second_common_resource_descriptor["type"] == ResourceType.TEST.value
 
 
+@pytest.mark.parametrize("padding_enabled", [True, False])
+def test_skip_resource_int_flags(padding_enabled):
+    gcf: BinaryIO = two_resource_gcf_file(padding_enabled)
+    header = file.read_header(gcf)
+    header = cast(Header, {**header, "flags": header["flags"].value})
+    first_common_resource_descriptor = file.read_common_resource_descriptor(gcf)
+
+    file.skip_resource(gcf, first_common_resource_descriptor, header)
+    second_common_resource_descriptor = file.read_common_resource_descriptor(gcf)
+
+    assert second_common_resource_descriptor["type"] == ResourceType.TEST.value
+
+
+@pytest.mark.parametrize("padding_enabled", [True, False])
+def test_skip_resources(padding_enabled):
+    gcf: BinaryIO = two_resource_gcf_file(padding_enabled)
+    header = file.read_header(gcf)
+    resources_offset = gcf.tell()
+
+    file.skip_resources(gcf, 0, header)
+
+    assert gcf.tell() == resources_offset
+
+    file.skip_resources(gcf, 1, header)
+    second_common_resource_descriptor = file.read_common_resource_descriptor(gcf)
+
+    assert second_common_resource_descriptor["type"] == ResourceType.TEST.value
+
+    gcf.seek(resources_offset)
+    file.skip_resources(gcf, 2, header)
+
+    assert gcf.read() == b""
+
+
 def test_read_write_mip_level_descriptor():
     test_file = io.BytesIO()
     expected_descriptor: MipLevelDescriptor = {
@@ -136,3 +173,261 @@ def test_read_write_mip_level():
 
     assert actual_layers == expected_layers
     assert actual_descriptor == level_descriptor
+
+
+@pytest.mark.parametrize("open_file", [open, gzip.open])
+def test_write_mip_level_non_rewritable(tmp_path, open_file):
+    expected_layers = [b"abcd", b"cdef"]
+    tex_descriptor = make_texture_resource_descriptor(
+        format_=Format.R8_UINT,
+        content_size=8 + MIP_LEVEL_SIZE,
+        supercompression_scheme=SupercompressionScheme.NO_COMPRESSION.value,
+        base_width=4,
+        layer_count=2,
+        flags=TextureFlags.TEXTURE_1D,
+    )
+    level_descriptor: MipLevelDescriptor = {
+        "compressed_size": 8,
+        "uncompressed_size": 8,
+        "layer_stride": 4,
+        "row_stride": 4,
+        "slice_stride": 4,
+    }
+    path = tmp_path / "test.gcf"
+
+    with open_file(path, "wb") as test_file:
+        test_file.write(b"head")
+
+    with open_file(path, "ab") as test_file:
+        assert not file.is_rewritable(test_file)
+
+        file.write_mip_level(test_file, SupercompressionScheme.NO_COMPRESSION.value, level_descriptor, expected_layers)
+
+    with open_file(path, "rb") as test_file:
+        assert test_file.read(4) == b"head"
+
+        actual_descriptor, actual_layers = file.read_mip_level(test_file, tex_descriptor)
+
+    assert actual_layers == expected_layers
+    assert actual_descriptor == level_descriptor
+
+
+def test_write_mip_level_unknown_scheme():
+    test_file = io.BytesIO(b"head")
+    test_file.seek(0, io.SEEK_END)
+    level_descriptor: MipLevelDescriptor = {
+        "compressed_size": 0,
+        "uncompressed_size": 0,
+        "layer_stride": 4,
+        "row_stride": 4,
+        "slice_stride": 4,
+    }
+
+    with pytest.raises(ValueError):
+        file.write_mip_level(test_file, 0x1234, level_descriptor, [b"abcd"])
+
+    assert test_file.tell() == 4
+    assert test_file.getvalue() == b"head"
+
+
+def test_read_mip_level_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(file, "MMAP_MIN_SIZE", 0)
+
+    expected_layers = [b"abcd", b"cdef"]
+    tex_descriptor = make_texture_resource_descriptor(
+        format_=Format.R8_UINT,
+        content_size=8 + MIP_LEVEL_SIZE,
+        supercompression_scheme=SupercompressionScheme.NO_COMPRESSION.value,
+        base_width=4,
+        layer_count=2,
+        flags=TextureFlags.TEXTURE_1D,
+    )
+    level_descriptor: MipLevelDescriptor = {
+        "compressed_size": 8,
+        "uncompressed_size": 8,
+        "layer_stride": 4,
+        "row_stride": 4,
+        "slice_stride": 4,
+    }
+    path = tmp_path / "test.gcf"
+
+    with open(path, "wb") as test_file:
+        file.write_mip_level(test_file, SupercompressionScheme.NO_COMPRESSION.value, level_descriptor, expected_layers)
+        test_file.write(b"tail")
+
+    payloads = []
+    read_payload = file.read_payload
+
+    def spy_read_payload(fileobj, size):
+        payloads.append(read_payload(fileobj, size))
+        return payloads[-1]
+
+    monkeypatch.setattr(file, "read_payload", spy_read_payload)
+
+    with open(path, "rb") as test_file:
+        actual_descriptor, actual_layers = file.read_mip_level(test_file, tex_descriptor)
+
+        assert test_file.read() == b"tail"
+
+    assert isinstance(payloads[0].obj, mmap.mmap)
+    assert not any(isinstance(layer.obj, mmap.mmap) for layer in actual_layers)
+
+    del payloads[:]
+    path.write_bytes(b"\0" * 4)
+
+    assert actual_layers == expected_layers
+    assert actual_descriptor == level_descriptor
+
+
+def test_read_payload_mmap_region(tmp_path, monkeypatch):
+    monkeypatch.setattr(file, "MMAP_MIN_SIZE", 0)
+
+    offset = mmap.ALLOCATIONGRANULARITY + 5
+    path = tmp_path / "test.bin"
+    path.write_bytes(bytes(offset) + b"payload" + b"tail")
+
+    with open(path, "rb") as test_file:
+        test_file.seek(offset)
+        payload = file.read_payload(test_file, 7)
+
+        assert test_file.read() == b"tail"
+
+    assert isinstance(payload.obj, mmap.mmap)
+    assert len(payload.obj) < offset
+    assert payload == b"payload"
+
+
+def test_read_payload_mmap_fallback(tmp_path, monkeypatch):
+    monkeypatch.setattr(file, "MMAP_MIN_SIZE", 0)
+
+    gzip_path = tmp_path / "test.bin.gz"
+
+    with gzip.open(gzip_path, "wb") as test_file:
+        test_file.write(b"headpayloadtail")
+
+    with gzip.open(gzip_path, "rb") as test_file:
+        test_file.seek(4)
+
+        assert file.read_payload(test_file, 7) == b"payload"
+        assert test_file.read() == b"tail"
+
+    tar_buffer = io.BytesIO()
+
+    with tarfile.open(fileobj=tar_buffer, mode="w") as tar:
+        member = tarfile.TarInfo("test.bin")
+        member.size = 15
+        tar.addfile(member, io.BytesIO(b"headpayloadtail"))
+
+    tar_buffer.seek(0)
+
+    with tarfile.open(fileobj=tar_buffer, mode="r") as tar:
+        test_file = cast(BinaryIO, tar.extractfile("test.bin"))
+        test_file.seek(4)
+
+        assert file.read_payload(test_file, 7) == b"payload"
+        assert test_file.read() == b"tail"
+
+
+def test_read_payload_truncated():
+    with pytest.raises(ValueError):
+        file.read_payload(io.BytesIO(b"abc"), 4)
+
+
+def test_read_payload_without_readinto():
+    class ReadOnlyFile:
+        def __init__(self, data):
+            self._file = io.BytesIO(data)
+            self.read = self._file.read
+            self.seek = self._file.seek
+            self.tell = self._file.tell
+
+    test_file = cast(BinaryIO, ReadOnlyFile(b"payloadtail"))
+
+    assert file.read_payload(test_file, 7) == b"payload"
+    assert test_file.read() == b"tail"
+
+    with pytest.raises(ValueError):
+        file.read_payload(test_file, 1)
+
+
+@pytest.mark.parametrize("use_executor", [False, True])
+def test_read_mip_levels(use_executor):
+    test_file = io.BytesIO()
+    expected_levels = [[b"abcdefgh", b"ijklmnop"], [b"abcd", b"efgh"]]
+    level_descriptor: MipLevelDescriptor = {
+        "compressed_size": 0,
+        "uncompressed_size": 0,
+        "layer_stride": 5,
+        "row_stride": 6,
+        "slice_stride": 7,
+    }
+
+    for layers in expected_levels:
+        file.write_mip_level(test_file, SupercompressionScheme.DEFLATE.value, level_descriptor, layers)
+
+    tex_descriptor = make_texture_resource_descriptor(
+        format_=Format.R8_UINT,
+        content_size=test_file.tell(),
+        supercompression_scheme=SupercompressionScheme.DEFLATE.value,
+        base_width=8,
+        layer_count=2,
+        mip_level_count=2,
+        flags=TextureFlags.TEXTURE_1D,
+    )
+    test_file.seek(0)
+
+    if use_executor:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            actual_levels = file.read_mip_levels(test_file, tex_descriptor, executor)
+    else:
+        actual_levels = file.read_mip_levels(test_file, tex_descriptor)
+
+    assert [layers for _, layers in actual_levels] == expected_levels
+    assert [descriptor["uncompressed_size"] for descriptor, _ in actual_levels] == [16, 8]
+    assert test_file.read() == b""
+
+
+@pytest.mark.parametrize("origin", range(9))
+def test_write_padding(origin):
+    header: Header = {"magic": make_magic_number(), "flags": ContainerFlags(0), "resource_count": 1}
+    test_file = io.BytesIO()
+    test_file.write(b"\xff" * origin)
+
+    file.write_padding(test_file, header)
+
+    assert test_file.tell() % 8 == 0
+    assert test_file.tell() - origin < 8
+    assert test_file.getvalue()[origin:] == b"\0" * (test_file.tell() - origin)
+
+
+@pytest.mark.parametrize("flags", [0, 1])
+def test_skip_padding_int_flags(flags):
+    header = cast(Header, {"magic": make_magic_number(), "flags": flags, "resource_count": 1})
+    test_file = io.BytesIO(b"\0" * 16)
+    test_file.seek(3)
+
+    file.skip_padding(test_file, header)
+
+    assert test_file.tell() == (3 if flags else 8)
+
+
+def test_skip_mip_levels():
+    test_file = io.BytesIO()
+    level_descriptor: MipLevelDescriptor = {
+        "compressed_size": 0,
+        "uncompressed_size": 0,
+        "layer_stride": 4,
+        "row_stride": 4,
+        "slice_stride": 4,
+    }
+
+    file.write_mip_level(test_file, SupercompressionScheme.DEFLATE.value, level_descriptor, [b"abcdefgh"])
+    file.write_mip_level(test_file, SupercompressionScheme.DEFLATE.value, level_descriptor, [b"abcd"])
+    expected_offset = test_file.tell()
+    file.write_mip_level(test_file, SupercompressionScheme.DEFLATE.value, level_descriptor, [b"ab"])
+    test_file.seek(0)
+
+    file.skip_mip_levels(test_file, 2)
+
+    assert test_file.tell() == expected_offset
+    assert file.read_mip_level_descriptor(test_file)["uncompressed_size"] == 2
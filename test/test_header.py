@@ -1,5 +1,7 @@
 import struct
 
+import pytest
+
 from gcf import ContainerFlags, Header, deserialize_header, make_magic_number, serialize_header
 
 
@@ -33,3 +35,17 @@ def test_make_magic_number():
     (expected,) = struct.unpack("<I", b"GC99")
 
     assert actual == expected
+
+
+@pytest.mark.parametrize("version", [-10, -1, 100])
+def test_make_magic_number_invalid_version(version):
+    with pytest.raises(ValueError):
+        make_magic_number(version)
+
+
+def test_deserialize_header_rejects_unknown_flags():
+    magic = make_magic_number()
+    raw = struct.pack("=I2H", magic, 1, 0x0003)
+
+    with pytest.raises(ValueError):
+        deserialize_header(raw)
@@ -49,3 +49,17 @@ def test_serialize_common_resource_descriptor():
     assert actual_content_size == 123
     assert actual_extension_size == 0
     assert actual_supercompression_scheme == SupercompressionScheme.TEST.value
+
+
+def test_deserialize_common_resource_descriptor_memoryview():
+    expected_descriptor: CommonResourceDescriptor = {
+        "type": ResourceType.TEST.value,
+        "format": Format.TEST,
+        "content_size": 123,
+        "extension_size": 0,
+        "supercompression_scheme": SupercompressionScheme.TEST.value,
+    }
+    raw = memoryview(b"\xff" * 4 + serialize_common_resource_descriptor(expected_descriptor))
+    actual_descriptor = deserialize_common_resource_descriptor(raw[4:])
+
+    assert expected_descriptor == actual_descriptor
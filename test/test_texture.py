@@ -1,5 +1,4 @@
 import struct
-from functools import reduce
 
 from gcf import (
     Format,
@@ -158,6 +157,29 @@ def test_serialize_deserialize_mip_level_data():
     assert actual_layers == expected_layers
 
 
+def test_deserialize_mip_level_data_no_copy():
+    raw = b"abcdcdef"
+
+    descriptor = make_texture_resource_descriptor(
+        format_=Format.R8_UINT,
+        content_size=123,
+        supercompression_scheme=SupercompressionScheme.NO_COMPRESSION.value,
+        base_width=4,
+        layer_count=2,
+        flags=TextureFlags.TEXTURE_1D,
+    )
+
+    layers = deserialize_mip_level_data(raw, descriptor)
+
+    assert all(layer.obj is raw for layer in layers)
+    assert layers == [b"abcd", b"cdef"]
+
+    copied_layers = deserialize_mip_level_data(raw, descriptor, copy=True)
+
+    assert all(isinstance(layer, bytes) for layer in copied_layers)
+    assert copied_layers == [b"abcd", b"cdef"]
+
+
 def test_serialize_mip_level_data():
     """Test against spec."""
 
@@ -178,6 +200,13 @@ def test_serialize_mip_level_data():
 
     raw = serialize_mip_level_data(layers, descriptor["supercompression_scheme"])
 
-    assert len(raw) == reduce(lambda x, layer: x + len(layer), layers, 0)
+    assert len(raw) == sum(map(len, layers))
     assert raw[0] == layers[0][0]
     assert raw[-1] == layers[-1][-1]
+
+
+def test_decode_texture_flags():
+    assert texture.decode_texture_flags(0x0001) is TextureFlags.TEXTURE_1D
+    assert texture.decode_texture_flags(0x0003) is TextureFlags.TEXTURE_2D
+    assert texture.decode_texture_flags(0x0007) is TextureFlags.TEXTURE_3D
+    assert texture.decode_texture_flags(0x0010) == TextureFlags(0x0010)
@@ -1,3 +1,5 @@
+import pytest
+
 from gcf.util import *
 
 
@@ -5,6 +7,21 @@ def test_compute_mip_level_size():
     assert compute_mip_level_size(0, 256, 256, 1) == (256, 256, 1)
     assert compute_mip_level_size(1, 256, 256, 1) == (128, 128, 1)
     assert compute_mip_level_size(2, 256, 128, 1) == (64, 32, 1)
+    assert compute_mip_level_size(1, 33, 35, 1) == (16, 18, 1)
+    assert compute_mip_level_size(3, 12, 20, 3) == (2, 2, 1)
+
+
+def test_compute_mip_level_size_vk():
+    assert compute_mip_level_size_vk(0, 256, 256, 1) == (256, 256, 1)
+    assert compute_mip_level_size_vk(2, 256, 128, 1) == (64, 32, 1)
+    assert compute_mip_level_size_vk(1, 33, 35, 1) == (16, 17, 1)
+    assert compute_mip_level_size_vk(9, 256, 128, 1) == (1, 1, 1)
+
+
+def test_compute_mip_chain_sizes():
+    assert compute_mip_chain_sizes(3, 256, 128, 1) == [(256, 128, 1), (128, 64, 1), (64, 32, 1)]
+    assert compute_mip_chain_sizes(3, 33, 35, 4) == [compute_mip_level_size(level, 33, 35, 4) for level in range(3)]
+    assert compute_mip_chain_sizes(0, 16, 16, 1) == []
 
 
 def test_compute_mip_level_resize_factor():
@@ -18,3 +35,16 @@ def test_align_size():
     assert align_size(257, 256) == 512
     assert align_size(0, 2) == 0
     assert align_size(2, 2) == 2
+    assert align_size(10, 3) == 12
+    assert align_size(12, 12) == 12
+
+
+def test_make_aligner():
+    align = make_aligner(16)
+
+    assert align(15) == 16
+    assert align(0) == 0
+    assert align(32) == 32
+
+    with pytest.raises(ValueError):
+        make_aligner(12)